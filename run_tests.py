@@ -6,6 +6,12 @@ test_modules = [
     "src.tests.test_data_quality",
     "src.tests.test_analysis",
     "src.tests.test_extractors",
+    "src.tests.test_collaborations",
+    "src.tests.test_similarity",
+    "src.tests.test_timeseries",
+    "src.tests.test_snapshot",
+    "src.tests.test_service",
+    "src.tests.test_bootstrap",
 ]
 
 
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+
+from src.utils.bootstrap import bootstrap_by_group, bootstrap_ci, compare_franchise_vs_standalone
+
+
+def test_bootstrap_ci_estimates():
+    values = np.array([1.0, 2.0, 3.0, 4.0, 100.0, np.nan, 5.0, 6.0, 7.0, 8.0, 9.0])
+
+    summary = bootstrap_ci(values, n_resamples=500, seed=0)
+
+    assert summary.loc["mean", "Estimate"] == np.mean(values[~np.isnan(values)])
+    assert summary.loc["median", "Estimate"] == 5.5
+    assert summary.loc["trimmed_mean", "Estimate"] == 5.5
+    assert (summary["CI Lower"] <= summary["Estimate"]).all()
+    assert (summary["CI Upper"] >= summary["Estimate"]).all()
+
+
+def test_index_and_count_resampling_agree():
+    values = np.random.default_rng(1).integers(0, 20, size=400).astype(float)
+
+    by_index = bootstrap_ci(values, n_resamples=4000, seed=0)
+    by_counts = bootstrap_ci(values, n_resamples=4000, seed=0, max_cells=0)
+
+    assert np.allclose(by_index["Estimate"], by_counts["Estimate"])
+    assert np.allclose(by_index[["CI Lower", "CI Upper"]], by_counts[["CI Lower", "CI Upper"]], atol=0.3)
+
+
+def test_binned_resampling_keeps_heavy_tailed_ci_width():
+    values = np.random.default_rng(2).lognormal(0.0, 1.5, size=3000)
+
+    exact = bootstrap_ci(values, n_resamples=3000, seed=0)
+    binned = bootstrap_ci(values, n_resamples=3000, seed=0, max_cells=0, max_support=64)
+
+    width_ratio = (binned["CI Upper"] - binned["CI Lower"]) / (exact["CI Upper"] - exact["CI Lower"])
+    assert width_ratio.between(0.9, 1.1).all()
+    assert np.allclose(binned[["CI Lower", "CI Upper"]], exact[["CI Lower", "CI Upper"]], rtol=0.05)
+
+
+def test_bootstrap_by_group_splits_pipes():
+    df = pd.DataFrame(
+        {
+            "genres": ["Action|Comedy", "Action", "Comedy", None],
+            "roi": [2.0, 4.0, 6.0, 8.0],
+        }
+    )
+
+    result = bootstrap_by_group(df, "genres", metrics={"roi": "ROI"}, split_pipes=True, n_resamples=100, seed=0)
+    means = result[result["Statistic"] == "mean"].set_index("genres")
+
+    assert list(means.index) == ["Action", "Comedy"]
+    assert means.loc["Action", "Estimate"] == 3.0
+    assert means.loc["Comedy", "Count"] == 2
+
+
+def test_compare_franchise_vs_standalone():
+    df = pd.DataFrame(
+        {
+            "belongs_to_collection": ["Collection", "Collection", None, None, None],
+            "revenue_musd": [300.0, 500.0, 50.0, 70.0, 90.0],
+        }
+    )
+
+    result = compare_franchise_vs_standalone(
+        df, metrics={"revenue_musd": "Revenue (M USD)"}, n_resamples=200, seed=0
+    )
+    medians = result[result["Statistic"] == "median"].set_index("Type")
+
+    assert medians.loc["Franchise", "Estimate"] == 400.0
+    assert medians.loc["Standalone", "Estimate"] == 70.0
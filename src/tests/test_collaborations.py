@@ -0,0 +1,135 @@
+import numpy as np
+import pandas as pd
+
+from src.utils import collaborations
+from src.utils.collaborations import (
+    build_incidence_matrix,
+    get_actor_collaborations,
+    get_bankable_pairings,
+    get_director_actor_collaborations,
+    get_successful_actors,
+)
+
+WACHOWSKIS = {"Lana Wachowski", "Lilly Wachowski"}
+
+MOVIES = {
+    "id": [603, 604, 1637, 346698, 331482],
+    "cast": [
+        "Keanu Reeves|Carrie-Anne Moss|Laurence Fishburne",
+        "Keanu Reeves|Carrie-Anne Moss|Laurence Fishburne",
+        "Keanu Reeves|Sandra Bullock",
+        "Margot Robbie|Ryan Gosling",
+        "Saoirse Ronan|Emma Watson",
+    ],
+    "directors": [
+        "Lana Wachowski|Lilly Wachowski",
+        "Lana Wachowski|Lilly Wachowski",
+        "Jan de Bont",
+        "Greta Gerwig",
+        "Greta Gerwig",
+    ],
+    "revenue_musd": [467.2, 741.8, 350.4, 1441.8, np.nan],
+    "vote_average": [8.2, 7.0, 7.3, 7.0, 7.8],
+}
+
+
+def test_build_incidence_matrix():
+    matrix, people = build_incidence_matrix(pd.DataFrame(MOVIES), "cast")
+
+    assert matrix.shape == (5, 8)
+    assert list(people[:3]) == ["Keanu Reeves", "Carrie-Anne Moss", "Laurence Fishburne"]
+    assert matrix.sum() == 12
+
+
+def test_build_incidence_matrix_top_billed():
+    df = pd.DataFrame(MOVIES)
+    df.loc[4, "cast"] = None
+    matrix, people = build_incidence_matrix(df, "cast", top_billed=1)
+
+    assert list(people) == ["Keanu Reeves", "Margot Robbie"]
+    assert matrix[4].sum() == 0
+    assert matrix.sum() == 4
+
+
+def test_get_successful_actors():
+    actors = get_successful_actors(pd.DataFrame(MOVIES))
+
+    assert actors.index[0] == "Keanu Reeves"
+    assert actors.loc["Keanu Reeves", "Total Movies"] == 3
+    assert actors.loc["Keanu Reeves", "Total Revenue"] == 1559.4
+    assert actors.loc["Carrie-Anne Moss", "Mean Rating"] == 7.6
+
+
+def test_get_director_actor_collaborations():
+    pairs = get_director_actor_collaborations(pd.DataFrame(MOVIES), top_k=1)
+
+    assert len(pairs) == 1
+    assert pairs.iloc[0]["Director"] in WACHOWSKIS
+    assert pairs.iloc[0]["Movies Together"] == 2
+
+
+def test_get_actor_collaborations():
+    pairs = get_actor_collaborations(pd.DataFrame(MOVIES), top_k=None)
+
+    assert len(pairs) == 6
+    assert list(pairs["Movies Together"]) == [2, 2, 2, 1, 1, 1]
+    assert {pairs.iloc[0]["Actor 1"], pairs.iloc[0]["Actor 2"]} <= {
+        "Keanu Reeves",
+        "Carrie-Anne Moss",
+        "Laurence Fishburne",
+    }
+
+
+def test_get_bankable_pairings():
+    pairs = get_bankable_pairings(pd.DataFrame(MOVIES), min_movies=2, top_k=None)
+
+    assert len(pairs) == 6
+    assert set(pairs["Director"]) == WACHOWSKIS
+    assert (pairs["Mean Revenue"] == 604.5).all()
+
+    # Little Women has no revenue, so its cast pair never qualifies
+    actor_pairs = get_bankable_pairings(pd.DataFrame(MOVIES), pair_type="actor_actor", min_movies=1, top_k=None)
+    assert len(actor_pairs) == 5
+    assert "Saoirse Ronan" not in set(actor_pairs["Actor 1"]) | set(actor_pairs["Actor 2"])
+
+
+def test_get_bankable_pairings_without_qualifying_pairs():
+    pairs = get_bankable_pairings(pd.DataFrame(MOVIES), min_movies=3)
+
+    assert pairs.empty
+    assert list(pairs.columns) == ["Director", "Actor", "Movies Together", "Mean Revenue"]
+
+
+def test_prebuilt_incidence_matrices_give_same_results():
+    df = pd.DataFrame(MOVIES)
+    cast = build_incidence_matrix(df, "cast")
+    directors = build_incidence_matrix(df, "directors")
+
+    assert get_successful_actors(df, cast=cast).equals(get_successful_actors(df))
+    assert get_actor_collaborations(df, cast=cast).equals(get_actor_collaborations(df))
+    assert get_bankable_pairings(df, cast=cast, directors=directors).equals(get_bankable_pairings(df))
+
+
+def test_blocked_pair_products_match_single_block():
+    df = pd.DataFrame(MOVIES)
+    expected = [
+        get_actor_collaborations(df, top_k=2),
+        get_director_actor_collaborations(df, top_k=None),
+        get_bankable_pairings(df, pair_type="actor_actor", min_movies=1, top_k=3),
+    ]
+
+    # One person per block exercises the running top-k merge
+    block_size = collaborations.PAIR_BLOCK_SIZE
+    collaborations.PAIR_BLOCK_SIZE = 1
+    try:
+        blocked = [
+            get_actor_collaborations(df, top_k=2),
+            get_director_actor_collaborations(df, top_k=None),
+            get_bankable_pairings(df, pair_type="actor_actor", min_movies=1, top_k=3),
+        ]
+    finally:
+        collaborations.PAIR_BLOCK_SIZE = block_size
+
+    for single, many in zip(expected, blocked):
+        assert list(single["Movies Together"]) == list(many["Movies Together"])
+        assert len(single) == len(many)
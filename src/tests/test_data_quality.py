@@ -1,6 +1,28 @@
+import numpy as np
 import pandas as pd
 
-from src.utils.data_quality import check_duplicates, check_outliers
+from src.utils import data_quality
+from src.utils.data_quality import (
+    DataValidator,
+    check_duplicates,
+    check_outliers,
+    in_range,
+    not_null,
+    validate_data,
+)
+
+MOVIES = {
+    "id": [1, 2, 2, 4],
+    "title": ["Movie A", None, "Movie B", "Movie D"],
+    "original_language": ["en", "fr", "zz", None],
+    "runtime": [120.0, 0.0, 95.0, None],
+    "vote_count": [10, 0, 5, 0],
+    "vote_average": [7.5, 6.0, 11.0, None],
+    "budget_musd": [10.0, 20.0, None, 5.0],
+    "revenue_musd": [30.0, 10.0, 5.0, None],
+    "profit": [20.0, -10.0, 5.0, None],
+    "roi": [3.0, 0.5, None, None],
+}
 
 
 def test_check_duplicates_with_duplicates():
@@ -45,3 +67,63 @@ def test_check_outliers_no_outliers():
 
     outliers = check_outliers(df, "budget")
     assert len(outliers) == 0
+
+
+def test_validate_data_counts_and_bitmask():
+    df = pd.DataFrame(MOVIES)
+
+    bitmask, summary = validate_data(df)
+
+    assert summary["title not null"] == 1
+    assert summary["id unique"] == 1
+    assert summary["runtime in (0, inf]"] == 1
+    assert summary["vote_average in [0, 10]"] == 1
+    assert summary["vote_count 0 implies no vote_average"] == 1
+    assert summary["profit matches formula"] == 1
+    assert summary["original_language allowed values"] == 1
+
+    assert bitmask[0] == 0
+    assert bitmask[1] != 0
+    assert "id unique" in DataValidator().decode(bitmask[2])
+
+
+def test_validator_chunks_match_full_frame():
+    df = pd.DataFrame(MOVIES)
+    validator = DataValidator()
+
+    chunk_masks = [validator.validate(df.iloc[start : start + 2]) for start in (0, 2)]
+    full_mask, full_summary = validate_data(df)
+
+    # The repeated id is in a later chunk than its first occurrence
+    assert "id unique" in validator.decode(chunk_masks[1][0])
+    assert (np.concatenate(chunk_masks) == full_mask).all()
+    assert validator.summary().equals(full_summary)
+    assert validator.rows == 4
+
+
+def test_validator_skips_rules_for_missing_columns():
+    validator = DataValidator([not_null("id"), in_range("runtime", min_value=0)])
+
+    bitmask = validator.validate(pd.DataFrame({"id": [1, None]}))
+
+    assert list(bitmask) == [0, 1]
+    assert validator.summary()["runtime in [0, inf]"] == 0
+
+
+def test_validator_converts_each_column_once():
+    conversions = []
+    to_numeric = data_quality.pd.to_numeric
+
+    def counting_to_numeric(series, *args, **kwargs):
+        conversions.append(series.name)
+        return to_numeric(series, *args, **kwargs)
+
+    data_quality.pd.to_numeric = counting_to_numeric
+    try:
+        validate_data(pd.DataFrame(MOVIES))
+    finally:
+        data_quality.pd.to_numeric = to_numeric
+
+    # revenue_musd and budget_musd feed a range rule and two formulas each
+    assert sorted(conversions) == sorted(set(conversions))
+    assert {"revenue_musd", "budget_musd", "vote_count"} <= set(conversions)
@@ -0,0 +1,163 @@
+import asyncio
+import json
+import os
+import signal
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from src.utils import service as service_module
+from src.utils.service import AnalyticsService
+from src.utils.snapshot import write_snapshot
+
+MOVIES = {
+    "id": [603, 604, 1637, 346698, 331482],
+    "title": ["The Matrix", "The Matrix Reloaded", "Speed", "Barbie", "Little Women"],
+    "release_date": pd.to_datetime(["1999-03-31", "2003-05-15", "1994-06-09", "2023-07-21", "2019-12-25"]),
+    "genres": [
+        "Action|Science Fiction",
+        "Action|Science Fiction",
+        "Action|Thriller",
+        "Comedy|Adventure",
+        "Drama|Romance",
+    ],
+    "belongs_to_collection": ["The Matrix Collection", "The Matrix Collection", None, None, None],
+    "cast": [
+        "Keanu Reeves|Carrie-Anne Moss|Laurence Fishburne",
+        "Keanu Reeves|Carrie-Anne Moss|Laurence Fishburne",
+        "Keanu Reeves|Sandra Bullock",
+        "Margot Robbie|Ryan Gosling",
+        "Saoirse Ronan|Emma Watson",
+    ],
+    "directors": [
+        "Lana Wachowski|Lilly Wachowski",
+        "Lana Wachowski|Lilly Wachowski",
+        "Jan de Bont",
+        "Greta Gerwig",
+        "Greta Gerwig",
+    ],
+    "budget_musd": [63.0, 150.0, 30.0, 145.0, 40.0],
+    "revenue_musd": [467.2, 741.8, 350.4, 1441.8, np.nan],
+    "roi": [7.42, 4.95, 11.68, 9.94, np.nan],
+    "popularity": [80.1, 40.2, 25.5, 120.3, 30.7],
+    "vote_average": [8.2, 7.0, 7.3, 7.0, 7.8],
+    "vote_count": [26000, 11000, 5400, 9000, 6000],
+}
+
+
+async def get(port, path):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+
+    head, body = response.split(b"\r\n\r\n", 1)
+    return int(head.split()[1]), json.loads(body)
+
+
+def run_with_service(scenario):
+    async def run():
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "movies")
+            write_snapshot(pd.DataFrame(MOVIES), path)
+
+            service = AnalyticsService(path, workers=1)
+            await service.start(port=0)
+            try:
+                return await scenario(service)
+            finally:
+                await service.close()
+
+    return asyncio.run(run())
+
+
+def test_service_endpoints():
+    async def scenario(service):
+        status, ranked = await get(service.port, "/rank?metric=revenue_musd&top_n=1")
+        assert status == 200
+        assert ranked[0]["title"] == "Barbie"
+
+        status, trends = await get(service.port, "/trends?freq=Y")
+        assert status == 200
+        assert sum(row["Movie Count"] for row in trends) == 5
+
+        status, error = await get(service.port, "/rank")
+        assert status == 400
+        assert "error" in error
+
+        status, _ = await get(service.port, "/unknown")
+        assert status == 404
+
+        status, stats = await get(service.port, "/stats")
+        assert stats["/rank"]["count"] == 2
+        assert stats["/trends"]["p50_ms"] >= 0
+
+    run_with_service(scenario)
+
+
+def test_identical_queries_are_coalesced_and_cached():
+    async def scenario(service):
+        results = await asyncio.gather(*[service.query("/franchises", {}) for _ in range(5)])
+        assert service.executions == 1
+        assert len(set(results)) == 1
+
+        await service.query("/franchises", {})
+        assert service.executions == 1
+
+        franchises = json.loads(results[0])
+        assert franchises[0]["belongs_to_collection"] == "The Matrix Collection"
+        assert np.isclose(franchises[0]["Total Revenue"], 1209.0)
+
+    run_with_service(scenario)
+
+
+def test_search_matches_user_input_literally():
+    async def scenario(service):
+        status, movies = await get(service.port, "/search?cast_member=(")
+        assert status == 200
+        assert movies == []
+
+        status, movies = await get(service.port, "/search?director=Jan%20de%20Bont&genres=Action,Thriller")
+        assert status == 200
+        assert [movie["title"] for movie in movies] == ["Speed"]
+
+    run_with_service(scenario)
+
+
+def test_unexpected_errors_return_500():
+    def failing_query(df, params):
+        raise RuntimeError("worker pool is broken")
+
+    async def scenario(service):
+        service_module.ENDPOINTS["/failing"] = (failing_query, False)
+        try:
+            status, error = await get(service.port, "/failing")
+        finally:
+            del service_module.ENDPOINTS["/failing"]
+
+        assert status == 500
+        assert error == {"error": "Internal server error"}
+        assert service.latency_stats()["/failing"]["count"] == 1
+
+    run_with_service(scenario)
+
+
+def test_broken_worker_pool_is_replaced():
+    async def scenario(service):
+        status, _ = await get(service.port, "/franchises")
+        assert status == 200
+
+        # Kill the workers: the pool is now broken
+        broken_pool = service._pool
+        for process in list(broken_pool._processes.values()):
+            os.kill(process.pid, signal.SIGKILL)
+            process.join()
+
+        status, directors = await get(service.port, "/directors")
+        assert status == 200
+        assert directors[0]["director"] == "Greta Gerwig"
+        assert service._pool is not broken_pool
+
+    run_with_service(scenario)
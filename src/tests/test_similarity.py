@@ -0,0 +1,96 @@
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from src.utils.similarity import (
+    build_feature_matrix,
+    compute_neighbor_index,
+    find_similar_movies,
+    load_neighbor_index,
+    save_neighbor_index,
+)
+
+MOVIES = {
+    "id": [603, 604, 1637, 346698, 331482],
+    "title": ["The Matrix", "The Matrix Reloaded", "Speed", "Barbie", "Little Women"],
+    "genres": [
+        "Action|Science Fiction",
+        "Action|Science Fiction",
+        "Action|Thriller",
+        "Comedy|Adventure",
+        "Drama|Romance",
+    ],
+    "belongs_to_collection": ["The Matrix Collection", "The Matrix Collection", None, None, None],
+    "production_companies": [
+        "Warner Bros.|Village Roadshow Pictures",
+        "Warner Bros.|Village Roadshow Pictures",
+        "20th Century Fox",
+        "Warner Bros.|Mattel Films",
+        "Columbia Pictures",
+    ],
+    "overview": [
+        "A hacker learns that his world is a simulation run by machines.",
+        "The hacker and his allies fight the machines to save the last human city.",
+        "A police officer must keep a bus above fifty miles per hour.",
+        "A doll leaves her perfect world to discover the real one.",
+        "Four sisters come of age in the years after the Civil War.",
+    ],
+    "cast": [
+        "Keanu Reeves|Carrie-Anne Moss|Laurence Fishburne",
+        "Keanu Reeves|Carrie-Anne Moss|Laurence Fishburne",
+        "Keanu Reeves|Sandra Bullock",
+        "Margot Robbie|Ryan Gosling",
+        "Saoirse Ronan|Emma Watson",
+    ],
+    "directors": [
+        "Lana Wachowski|Lilly Wachowski",
+        "Lana Wachowski|Lilly Wachowski",
+        "Jan de Bont",
+        "Greta Gerwig",
+        "Greta Gerwig",
+    ],
+}
+
+
+def test_build_feature_matrix_rows_are_unit_length():
+    features = build_feature_matrix(pd.DataFrame(MOVIES))
+
+    norms = np.sqrt(features.multiply(features).sum(axis=1))
+    assert np.allclose(norms, 1.0)
+
+
+def test_find_similar_movies():
+    similar = find_similar_movies(pd.DataFrame(MOVIES), "The Matrix", top_k=2)
+
+    assert list(similar["title"]) == ["The Matrix Reloaded", "Speed"]
+    assert similar["similarity"].is_monotonic_decreasing
+
+
+def test_neighbor_index_matches_single_queries():
+    df = pd.DataFrame(MOVIES)
+    features = build_feature_matrix(df)
+    neighbors, scores = compute_neighbor_index(features, top_k=2, batch_size=3)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "neighbors.npz")
+        save_neighbor_index(path, df, neighbors, scores)
+        index = load_neighbor_index(path, df)
+
+    from_index = find_similar_movies(df, 603, top_k=2, neighbor_index=index)
+    direct = find_similar_movies(df, 603, features=features, top_k=2)
+    assert list(from_index["id"]) == list(direct["id"])
+
+
+def test_neighbor_index_path_without_suffix():
+    df = pd.DataFrame(MOVIES)
+    neighbors, scores = compute_neighbor_index(build_feature_matrix(df), top_k=2)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "neighbors")
+        save_neighbor_index(path, df, neighbors, scores)
+        loaded_neighbors, _ = load_neighbor_index(path, df)
+
+        assert os.listdir(tmp_dir) == ["neighbors.npz"]
+        assert np.array_equal(loaded_neighbors, neighbors)
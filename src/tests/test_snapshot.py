@@ -0,0 +1,136 @@
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from src.utils.analysis import rank_movies, search_movies
+from src.utils.collaborations import get_bankable_pairings, get_successful_actors
+from src.utils.similarity import find_similar_movies
+from src.utils.snapshot import open_snapshot, write_snapshot
+
+MOVIES = {
+    "id": [603, 604, 1637, 346698, 331482],
+    "title": ["The Matrix", "The Matrix Reloaded", "Speed", "Barbie", "Little Women"],
+    "release_date": pd.to_datetime(["1999-03-31", "2003-05-15", "1994-06-09", "2023-07-21", "2019-12-25"]),
+    "genres": [
+        "Action|Science Fiction",
+        "Action|Science Fiction",
+        "Action|Thriller",
+        "Comedy|Adventure",
+        "Drama|Romance",
+    ],
+    "belongs_to_collection": ["The Matrix Collection", "The Matrix Collection", None, None, None],
+    "production_companies": [
+        "Warner Bros.|Village Roadshow Pictures",
+        "Warner Bros.|Village Roadshow Pictures",
+        "20th Century Fox",
+        "Warner Bros.|Mattel Films",
+        "Columbia Pictures",
+    ],
+    "overview": [
+        "A hacker learns that his world is a simulation run by machines.",
+        "The hacker and his allies fight the machines to save the last human city.",
+        "A police officer must keep a bus above fifty miles per hour.",
+        "A doll leaves her perfect world to discover the real one.",
+        "Four sisters come of age in the years after the Civil War.",
+    ],
+    "cast": [
+        "Keanu Reeves|Carrie-Anne Moss|Laurence Fishburne",
+        "Keanu Reeves|Carrie-Anne Moss|Laurence Fishburne",
+        "Keanu Reeves|Sandra Bullock",
+        "Margot Robbie|Ryan Gosling",
+        "Saoirse Ronan|Emma Watson",
+    ],
+    "directors": [
+        "Lana Wachowski|Lilly Wachowski",
+        "Lana Wachowski|Lilly Wachowski",
+        "Jan de Bont",
+        "Greta Gerwig",
+        "Greta Gerwig",
+    ],
+    "revenue_musd": [467.2, 741.8, 350.4, 1441.8, np.nan],
+    "vote_average": [8.2, 7.0, 7.3, 7.0, 7.8],
+    "vote_count": [26000, 11000, 5400, 9000, 6000],
+}
+
+
+def is_memory_mapped(array):
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base
+    return False
+
+
+def test_snapshot_round_trip():
+    df = pd.DataFrame(MOVIES)
+    df.loc[1, "title"] = "Matrix Reloaded: Amélie"
+    df.loc[4, "release_date"] = pd.NaT
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "movies")
+        write_snapshot(df, path)
+        snapshot = open_snapshot(path)
+
+        assert list(snapshot.columns) == list(df.columns)
+        assert snapshot["title"].tolist() == df["title"].tolist()
+        assert snapshot["belongs_to_collection"].isna().tolist() == [False, False, True, True, True]
+        assert snapshot["release_date"].isna().tolist() == [False, False, False, False, True]
+        assert np.array_equal(snapshot["revenue_musd"].to_numpy(), df["revenue_musd"].to_numpy(), equal_nan=True)
+
+
+def test_snapshot_is_memory_mapped_and_usable():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "movies")
+        write_snapshot(pd.DataFrame(MOVIES), path)
+        snapshot = open_snapshot(path, columns=["id", "title", "vote_count", "cast"])
+
+        assert is_memory_mapped(snapshot["vote_count"].to_numpy())
+        assert snapshot["title"].dtype == "str"
+
+        assert rank_movies(snapshot, "vote_count", top_n=1).iloc[0]["title"] == "The Matrix"
+        assert search_movies(snapshot, cast_member="Keanu")["id"].tolist() == [603, 604, 1637]
+
+        # Mapped pages are copy-on-write: edits stay private to this frame
+        snapshot.loc[0, "title"] = "Matrix"
+        snapshot.loc[0, "vote_count"] = 1
+        reopened = open_snapshot(path, columns=["title", "vote_count"])
+        assert reopened.loc[0, "title"] == "The Matrix"
+        assert reopened.loc[0, "vote_count"] == 26000
+
+
+def test_collaboration_and_similarity_queries_on_snapshot():
+    df = pd.DataFrame(MOVIES)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "movies")
+        write_snapshot(df, path)
+        snapshot = open_snapshot(path)
+
+        assert get_successful_actors(snapshot).equals(get_successful_actors(df))
+        assert get_bankable_pairings(snapshot).equals(get_bankable_pairings(df))
+
+        similar = find_similar_movies(snapshot, "The Matrix", top_k=2)
+        assert similar["id"].tolist() == find_similar_movies(df, "The Matrix", top_k=2)["id"].tolist()
+
+
+def test_rewriting_snapshot_leaves_open_readers_intact():
+    df = pd.DataFrame(MOVIES)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "movies")
+        write_snapshot(df, path)
+        old = open_snapshot(path)
+        old_files = set(os.listdir(path))
+
+        write_snapshot(df.assign(vote_count=df["vote_count"] + 1).iloc[:2], path)
+        new = open_snapshot(path)
+
+        assert old["vote_count"].tolist() == df["vote_count"].tolist()
+        assert old["title"].tolist() == df["title"].tolist()
+        assert new["vote_count"].tolist() == [26001, 11001]
+
+        # Old column files are unlinked, never overwritten in place
+        assert len(os.listdir(path)) == len(old_files)
+        assert set(os.listdir(path)) & old_files == {"manifest.json"}
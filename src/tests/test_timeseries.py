@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+
+from src.utils.timeseries import ReleaseTrends
+
+MOVIES = {
+    "release_date": pd.to_datetime(["2019-01-15", "2019-02-01", "2019-11-30", "2021-05-05", None, "2022-01-01"]),
+    "revenue_musd": [100.0, 300.0, np.nan, 50.0, 10.0, 1.0],
+    "budget_musd": [50.0, 100.0, 20.0, 25.0, 5.0, 1.0],
+    "roi": [2.0, 3.0, np.nan, 2.0, 2.0, 1.0],
+}
+
+
+def test_yearly_trends_match_groupby():
+    df = pd.DataFrame(MOVIES).iloc[:5]
+    yearly = ReleaseTrends(df).trends("Y")
+
+    expected = df.groupby(df["release_date"].dt.year)["revenue_musd"].agg(["count", "mean"])
+    assert list(yearly.index.year) == [2019, 2020, 2021]
+    assert list(yearly["Movie Count"]) == [3, 0, 1]
+    assert yearly["Mean Revenue"].iloc[0] == expected.loc[2019, "mean"]
+    assert np.isnan(yearly["Mean Revenue"].iloc[1])
+
+    with_revenue = ReleaseTrends(df).trends("Y", count_metric="revenue_musd")
+    assert with_revenue.loc[pd.Period("2019", "Y"), "Movie Count"] == expected.loc[2019, "count"]
+
+
+def test_window_and_rolling():
+    trends = ReleaseTrends(pd.DataFrame(MOVIES).iloc[:3])
+
+    first_quarter = trends.window("2019-01-01", "2019-03-31")
+    assert first_quarter["Movie Count"] == 2
+    assert first_quarter["Mean Budget"] == 75.0
+
+    rolling = trends.trends("M", rolling=2)
+    assert rolling.loc[pd.Period("2019-02", "M"), "Movie Count"] == 2
+    assert rolling.loc[pd.Period("2019-03", "M"), "Movie Count"] == 1
+
+
+def test_incremental_append_matches_full_build():
+    df = pd.DataFrame(MOVIES)
+
+    # Earlier, later and date-less movies arrive after the initial build
+    trends = ReleaseTrends(df.iloc[2:4])
+    trends.append(df.iloc[:2])
+    trends.append(df.iloc[5:])
+    trends.append(df.iloc[4:5])
+
+    full = ReleaseTrends(df)
+    pd.testing.assert_frame_equal(trends.trends("Q"), full.trends("Q"))
+
+
+def test_trends_without_release_dates():
+    yearly = ReleaseTrends(pd.DataFrame(MOVIES).iloc[4:5]).trends("Y")
+
+    assert yearly.empty
+    assert isinstance(yearly.index, pd.PeriodIndex)
+    assert list(yearly.columns) == ["Movie Count", "Mean Revenue", "Mean Budget", "Mean ROI"]
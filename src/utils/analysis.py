@@ -28,6 +28,19 @@ def rank_movies(df, metric, top_n=5, ascending=False, min_budget=None, min_votes
     return data.sort_values(by=metric, ascending=ascending).head(top_n)
 
 
+def is_franchise(df):
+    """
+    Flag movies that belong to a collection.
+
+    Args:
+        df: Movie DataFrame
+
+    Returns:
+        Boolean Series, True for franchise movies
+    """
+    return df["belongs_to_collection"].notna()
+
+
 def analyze_franchise_vs_standalone(df):
     """
     Compare franchise vs standalone movie performance.
@@ -39,8 +52,8 @@ def analyze_franchise_vs_standalone(df):
         Comparison DataFrame with key metrics
     """
     # get franchise and standalone movies
-    franchise = df[df["belongs_to_collection"].notna()]
-    standalone = df[df["belongs_to_collection"].isna()]
+    franchise = df[is_franchise(df)]
+    standalone = df[~is_franchise(df)]
 
     # calculate comparison metrics
     comparison = pd.DataFrame(
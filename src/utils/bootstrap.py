@@ -0,0 +1,238 @@
+"""
+Bootstrap confidence intervals for means, medians and trimmed means.
+
+Resampling is fully vectorized. Small samples draw one (resamples x n)
+index matrix. Large samples split the sorted values into contiguous bins
+and draw, for each resample, how many picks land in each bin (one
+multinomial draw per resample), which costs O(resamples x bins) instead
+of O(resamples x n). Given those counts, the picks inside a bin are
+uniform draws from its values, so:
+
+- order statistics (the median) are read from the sorted values inside
+  the bin, at a rank drawn from the exact Beta distribution
+- bin sums (the mean and trimmed mean) add a normal term with the
+  within-bin variance
+
+With one bin per distinct value both are exact. Otherwise the most
+extreme values keep bins of their own, so heavy tails are resampled
+exactly and only the narrow middle bins are approximated.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.utils.analysis import is_franchise
+
+STATISTICS = ("mean", "median", "trimmed_mean")
+
+RESULT_COLUMNS = ["Metric", "Statistic", "Count", "Estimate", "CI Lower", "CI Upper"]
+
+# Metric columns compared by default, with display names
+DEFAULT_METRICS = {
+    "revenue_musd": "Revenue (M USD)",
+    "roi": "ROI",
+    "budget_musd": "Budget (M USD)",
+    "popularity": "Popularity",
+    "vote_average": "Rating",
+}
+
+
+def _trim_count(n, trim):
+    """Values cut from each end, matching scipy.stats.trim_mean."""
+    return int(trim * n)
+
+
+def _sample_statistics(sorted_samples, trim):
+    """Statistics of each row of an array whose rows are sorted."""
+    n = sorted_samples.shape[1]
+    cut = _trim_count(n, trim)
+    return {
+        "mean": sorted_samples.mean(axis=1),
+        "median": np.median(sorted_samples, axis=1),
+        "trimmed_mean": sorted_samples[:, cut : n - cut].mean(axis=1),
+    }
+
+
+def _bins(values, max_support):
+    """
+    Split sorted values into at most max_support contiguous bins.
+
+    Returns (start, size) arrays: one bin per distinct value when there
+    are few, otherwise singleton bins for the max_support // 8 smallest
+    and largest values and equal-size bins in between.
+    """
+    n = len(values)
+    _, starts, sizes = np.unique(values, return_index=True, return_counts=True)
+    if len(starts) <= max_support:
+        return starts, sizes
+
+    tail = max_support // 8
+    middle = np.linspace(tail, n - tail, max_support - 2 * tail + 1)[:-1].astype(np.int64)
+    starts = np.unique(np.concatenate([np.arange(tail), middle, np.arange(n - tail, n)]))
+
+    return starts, np.diff(np.append(starts, n))
+
+
+def _count_statistics(values, starts, sizes, counts, trim, rng):
+    """Statistics of resamples given as pick counts per bin of the sorted values."""
+    n_resamples, n = counts.shape[0], len(values)
+    resamples = np.arange(n_resamples)
+    cumulative = counts.cumsum(axis=1)
+
+    bin_means = np.add.reduceat(values, starts) / sizes
+    bin_variances = np.add.reduceat((values - np.repeat(bin_means, sizes)) ** 2, starts) / sizes
+
+    def locate(k):
+        # Bin holding sorted position k, the rank of k among that bin's picks, and the bin's picks
+        b = (cumulative > k).argmax(axis=1)
+        picks = counts[resamples, b]
+        return b, k - (cumulative[resamples, b] - picks), picks
+
+    def value_at(b, u):
+        # u is the uniform order statistic; flooring it into the bin picks a sorted value
+        return values[starts[b] + np.minimum((u * sizes[b]).astype(np.int64), sizes[b] - 1)]
+
+    # The r-th smallest of c uniform picks follows Beta(r + 1, c - r)
+    b, rank, picks = locate((n - 1) // 2)
+    u = rng.beta(rank + 1, picks - rank)
+    median = value_at(b, u)
+    if n % 2 == 0:
+        # The next pick is the smallest of the rest: above u in the same bin, or in the next bin
+        next_b, next_rank, next_picks = locate(n // 2)
+        next_u = np.where(
+            next_b == b,
+            u + (1 - u) * rng.beta(1, np.maximum(picks - rank - 1, 1)),
+            rng.beta(next_rank + 1, next_picks - next_rank),
+        )
+        median = (median + value_at(next_b, next_u)) / 2
+
+    # Positions [cut, n - cut) survive trimming; count how many fall in each bin
+    cut = _trim_count(n, trim)
+    kept = np.clip(cumulative, cut, n - cut) - np.clip(cumulative - counts, cut, n - cut)
+
+    def bin_sums(picks):
+        # Sum of the picked values: bin means plus the spread of picks within each bin
+        noise = np.sqrt(picks @ bin_variances) * rng.standard_normal(n_resamples)
+        return picks @ bin_means + noise
+
+    return {
+        "mean": bin_sums(counts) / n,
+        "median": median,
+        "trimmed_mean": bin_sums(kept) / (n - 2 * cut),
+    }
+
+
+def bootstrap_ci(
+    values,
+    statistics=STATISTICS,
+    n_resamples=10_000,
+    confidence=0.95,
+    trim=0.1,
+    seed=None,
+    max_cells=20_000_000,
+    max_support=1024,
+):
+    """
+    Estimate statistics with percentile bootstrap confidence intervals.
+
+    Args:
+        values: Array-like of observations (NaN values are ignored)
+        statistics: Any of 'mean', 'median', 'trimmed_mean'
+        n_resamples: Number of bootstrap resamples
+        confidence: Confidence level of the intervals
+        trim: Fraction cut from each end for the trimmed mean
+        seed: Random seed for reproducible intervals
+        max_cells: Largest resamples x n index matrix drawn directly
+        max_support: Bins used when resampling by counts (with more
+            distinct values than this, bin sums are approximated)
+
+    Returns:
+        DataFrame indexed by statistic with 'Estimate', 'CI Lower', 'CI Upper'
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = np.sort(values[~np.isnan(values)])
+    n = len(values)
+
+    unknown = set(statistics) - set(STATISTICS)
+    if unknown:
+        raise ValueError(f"Unknown statistics {sorted(unknown)}, expected any of {STATISTICS}")
+    if n == 0:
+        return pd.DataFrame(np.nan, index=list(statistics), columns=["Estimate", "CI Lower", "CI Upper"])
+
+    rng = np.random.default_rng(seed)
+    estimates = _sample_statistics(values[np.newaxis, :], trim)
+
+    if n * n_resamples <= max_cells:
+        # Indices drawn into sorted data, then sorted, give sorted resamples
+        indices = np.sort(rng.integers(0, n, size=(n_resamples, n)), axis=1)
+        resampled = _sample_statistics(values[indices], trim)
+    else:
+        starts, sizes = _bins(values, max_support)
+        counts = rng.multinomial(n, sizes / n, size=n_resamples)
+        resampled = _count_statistics(values, starts, sizes, counts, trim, rng)
+
+    alpha = (1 - confidence) / 2
+    rows = []
+    for name in statistics:
+        lower, upper = np.quantile(resampled[name], [alpha, 1 - alpha])
+        rows.append((estimates[name][0], lower, upper))
+
+    return pd.DataFrame(rows, index=list(statistics), columns=["Estimate", "CI Lower", "CI Upper"])
+
+
+def bootstrap_by_group(df, by, metrics=None, split_pipes=False, **kwargs):
+    """
+    Bootstrap confidence intervals of each metric within each group.
+
+    Args:
+        df: Movie DataFrame
+        by: Grouping column name, or a Series aligned with df
+            (e.g., df['release_date'].dt.year // 10 * 10 for decades)
+        metrics: Dict of column -> display name (defaults to DEFAULT_METRICS)
+        split_pipes: Split pipe-separated groups (e.g., 'genres') so a movie
+            counts towards each of its groups
+        **kwargs: Passed to bootstrap_ci
+
+    Returns:
+        Long-format DataFrame with one row per group, metric and statistic
+    """
+    metrics = DEFAULT_METRICS if metrics is None else metrics
+    groups = df[by] if isinstance(by, str) else by
+    name = groups.name if groups.name is not None else "Group"
+
+    data = df[list(metrics)].assign(_group=groups.to_numpy())
+    if split_pipes:
+        data = data.assign(_group=data["_group"].str.split("|")).explode("_group")
+
+    results = []
+    for group, group_data in data.groupby("_group", sort=True):
+        for column, label in metrics.items():
+            summary = bootstrap_ci(group_data[column], **kwargs)
+            summary.insert(0, "Count", int(group_data[column].notna().sum()))
+            summary = summary.rename_axis("Statistic").reset_index()
+            results.append(summary.assign(**{name: group, "Metric": label}))
+
+    if not results:
+        return pd.DataFrame(columns=[name, *RESULT_COLUMNS])
+
+    return pd.concat(results, ignore_index=True)[[name, *RESULT_COLUMNS]]
+
+
+def compare_franchise_vs_standalone(df, metrics=None, **kwargs):
+    """
+    Compare franchise and standalone movies with bootstrap confidence intervals.
+
+    Args:
+        df: Movie DataFrame
+        metrics: Dict of column -> display name (defaults to DEFAULT_METRICS)
+        **kwargs: Passed to bootstrap_ci
+
+    Returns:
+        Long-format DataFrame with one row per group, metric and statistic
+    """
+    groups = pd.Series(
+        np.where(is_franchise(df), "Franchise", "Standalone"),
+        index=df.index,
+        name="Type",
+    )
+    return bootstrap_by_group(df, groups, metrics=metrics, **kwargs).round(2)
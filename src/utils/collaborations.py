@@ -0,0 +1,264 @@
+"""
+Cast and crew collaboration analytics built on sparse incidence matrices.
+
+Every movie x person relationship is stored once in a CSR matrix, so
+per-person aggregates become sparse matrix-vector products and pair
+co-occurrence becomes a sparse matrix product. Pair products are computed
+a block of people at a time (only the upper triangle for actor pairs),
+keeping a running top-k, so the full people x people matrix never has to
+fit in memory.
+"""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from scipy import sparse
+
+# People per block when computing pair co-occurrence
+PAIR_BLOCK_SIZE = 4096
+
+
+def build_incidence_matrix(df, column, top_billed=None):
+    """
+    Build a sparse movie x person incidence matrix from a pipe-separated column.
+
+    Args:
+        df: Movie DataFrame
+        column: Pipe-separated column (e.g., 'cast', 'directors')
+        top_billed: Only keep the first N names per movie (None = keep all)
+
+    Returns:
+        Tuple of (CSR matrix of shape (movies, people), Index of person names)
+    """
+    # Arrow kernels split and factorize the whole column without building a Python list per movie
+    entries = pa.array(df[column], from_pandas=True)
+    if isinstance(entries, pa.ChunkedArray):
+        entries = entries.combine_chunks()
+    entries = pc.fill_null(pc.cast(entries, pa.large_string()), "")
+    tokens = pc.split_pattern(entries, "|")
+    lengths = pc.list_value_length(tokens).to_numpy()
+    tokens = pc.list_flatten(tokens)
+
+    rows = np.repeat(np.arange(len(entries)), lengths)
+    positions = np.arange(len(tokens)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+
+    keep = pc.not_equal(tokens, "").to_numpy(zero_copy_only=False)
+    if top_billed is not None:
+        keep &= positions < top_billed
+
+    encoded = pc.filter(tokens, keep).dictionary_encode()
+    codes, people = encoded.indices.to_numpy(), encoded.dictionary.to_pylist()
+    matrix = sparse.csr_matrix(
+        (np.ones(len(codes), dtype=np.float32), (rows[keep], codes)),
+        shape=(len(entries), len(people)),
+    )
+
+    # A name listed twice for the same movie still counts as one credit
+    matrix.sum_duplicates()
+    matrix.data[:] = 1.0
+
+    return matrix, pd.Index(people, name=column)
+
+
+def _column_sums(matrix, values):
+    """Sum values per person, ignoring NaN, and count the non-NaN contributions."""
+    values = np.asarray(values, dtype=np.float64)
+    present = ~np.isnan(values)
+    totals = matrix.T @ np.where(present, values, 0.0)
+    counts = matrix.T @ present.astype(np.float64)
+    return totals, counts
+
+
+def _incidence(df, column, prebuilt, top_billed=None):
+    """Use a prebuilt (matrix, names) pair when given, otherwise build one."""
+    if prebuilt is not None:
+        return prebuilt
+    return build_incidence_matrix(df, column, top_billed=top_billed)
+
+
+def _pair_blocks(left, right, weights=None, upper=False):
+    """
+    Yield (rows, cols, values) of left.T @ diag(weights) @ right, one block of left people at a time.
+
+    With upper=True (left is right) only pairs with row < col are kept.
+    """
+    left_t = left.T.tocsr() if weights is None else (left.T @ sparse.diags(weights)).tocsr()
+    right = right.tocsr()
+
+    for start in range(0, left_t.shape[0], PAIR_BLOCK_SIZE):
+        block = (left_t[start : start + PAIR_BLOCK_SIZE] @ right).tocoo()
+        rows = block.row.astype(np.int64) + start
+        cols = block.col.astype(np.int64)
+        keep = cols > rows if upper else slice(None)
+        yield rows[keep], cols[keep], block.data[keep]
+
+
+def _top_k_pairs(blocks, k):
+    """
+    Merge (scores, ...) array tuples from each block into the k best by score, best first.
+
+    Only the running top k survive each block, so memory stays bounded
+    by one block plus k (all pairs are kept when k is None).
+    """
+    kept = []
+    for block in blocks:
+        kept.append(block)
+        if k is not None:
+            merged = tuple(np.concatenate(arrays) for arrays in zip(*kept))
+            if len(merged[0]) > k:
+                best = np.argpartition(-merged[0], k - 1)[:k]
+                merged = tuple(array[best] for array in merged)
+            kept = [merged]
+
+    if not kept:
+        return None
+    merged = tuple(np.concatenate(arrays) for arrays in zip(*kept))
+    order = np.argsort(-merged[0], kind="stable")
+    return tuple(array[order] for array in merged)
+
+
+def _pair_counts(left, right, left_names, right_names, labels, top_k, upper=False):
+    """Top pairs by number of shared movies as a DataFrame."""
+    scored = ((counts, rows, cols) for rows, cols, counts in _pair_blocks(left, right, upper=upper))
+    best = _top_k_pairs(scored, top_k)
+    counts, rows, cols = best if best is not None else (np.empty(0), [], [])
+
+    return pd.DataFrame(
+        {
+            labels[0]: left_names[rows],
+            labels[1]: right_names[cols],
+            "Movies Together": counts.astype(int),
+        }
+    )
+
+
+def get_successful_actors(df, top_billed=None, cast=None):
+    """
+    Analyze actor performance.
+
+    Args:
+        df: Movie DataFrame
+        top_billed: Only credit the first N cast members of each movie
+        cast: Optional prebuilt build_incidence_matrix(df, 'cast') result
+
+    Returns:
+        DataFrame with actor statistics
+    """
+    cast, actors = _incidence(df, "cast", cast, top_billed)
+
+    movie_counts = np.asarray(cast.sum(axis=0)).ravel()
+    total_revenue, _ = _column_sums(cast, df["revenue_musd"])
+    total_rating, rated = _column_sums(cast, df["vote_average"])
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_rating = total_rating / rated
+
+    performance = pd.DataFrame(
+        {
+            "Total Movies": movie_counts.astype(int),
+            "Total Revenue": total_revenue,
+            "Mean Rating": mean_rating,
+        },
+        index=actors.rename("actor"),
+    ).round(2)
+
+    return performance.sort_values(by=["Total Movies", "Total Revenue"], ascending=False)
+
+
+def get_director_actor_collaborations(df, top_k=10, top_billed=None, cast=None, directors=None):
+    """
+    Count how often each director and actor worked together.
+
+    Args:
+        df: Movie DataFrame
+        top_k: Number of pairs to return (None = all pairs)
+        top_billed: Only credit the first N cast members of each movie
+        cast: Optional prebuilt build_incidence_matrix(df, 'cast') result
+        directors: Optional prebuilt build_incidence_matrix(df, 'directors') result
+
+    Returns:
+        DataFrame of director/actor pairs sorted by movies together
+    """
+    directors, director_names = _incidence(df, "directors", directors)
+    cast, actor_names = _incidence(df, "cast", cast, top_billed)
+
+    return _pair_counts(directors, cast, director_names, actor_names, ["Director", "Actor"], top_k)
+
+
+def get_actor_collaborations(df, top_k=10, top_billed=None, cast=None):
+    """
+    Count how often each pair of actors appeared in the same movie.
+
+    Args:
+        df: Movie DataFrame
+        top_k: Number of pairs to return (None = all pairs)
+        top_billed: Only credit the first N cast members of each movie
+        cast: Optional prebuilt build_incidence_matrix(df, 'cast') result
+
+    Returns:
+        DataFrame of actor pairs sorted by movies together
+    """
+    cast, actor_names = _incidence(df, "cast", cast, top_billed)
+
+    # Upper triangle only: drop self pairs and count each pair once
+    return _pair_counts(cast, cast, actor_names, actor_names, ["Actor 1", "Actor 2"], top_k, upper=True)
+
+
+def get_bankable_pairings(
+    df, pair_type="director_actor", min_movies=2, top_k=10, top_billed=None, cast=None, directors=None
+):
+    """
+    Find the pairings with the highest mean revenue per shared movie.
+
+    Args:
+        df: Movie DataFrame
+        pair_type: 'director_actor' or 'actor_actor'
+        min_movies: Minimum number of shared movies with known revenue
+        top_k: Number of pairs to return (None = all qualifying pairs)
+        top_billed: Only credit the first N cast members of each movie
+        cast: Optional prebuilt build_incidence_matrix(df, 'cast') result
+        directors: Optional prebuilt build_incidence_matrix(df, 'directors') result
+
+    Returns:
+        DataFrame of pairs sorted by mean revenue
+    """
+    cast, actor_names = _incidence(df, "cast", cast, top_billed)
+
+    if pair_type == "director_actor":
+        left, left_names = _incidence(df, "directors", directors)
+        labels = ["Director", "Actor"]
+    elif pair_type == "actor_actor":
+        left, left_names = cast, actor_names
+        labels = ["Actor 1", "Actor 2"]
+    else:
+        raise ValueError(f"Unknown pair_type '{pair_type}'")
+
+    revenue = df["revenue_musd"].to_numpy(dtype=np.float64)
+    has_revenue = ~np.isnan(revenue)
+
+    # Weight each movie by revenue + 1j: one product then holds the revenue
+    # total of every pair in its real part and the shared movie count in its
+    # imaginary part, and a pair is never dropped because its total is zero
+    weights = np.where(has_revenue, revenue + 1j, 0).astype(np.complex64)
+
+    def scored(blocks):
+        for rows, cols, values in blocks:
+            counts = np.rint(values.imag)
+            qualifying = counts >= min_movies
+            counts = counts[qualifying]
+            means = values.real[qualifying].astype(np.float64) / counts
+            yield means, rows[qualifying], cols[qualifying], counts
+
+    blocks = _pair_blocks(left, cast, weights=weights, upper=pair_type == "actor_actor")
+    best = _top_k_pairs(scored(blocks), top_k)
+    means, rows, cols, counts = best if best is not None else (np.empty(0), [], [], np.empty(0))
+
+    return pd.DataFrame(
+        {
+            labels[0]: left_names[rows],
+            labels[1]: actor_names[cols],
+            "Movies Together": counts.astype(int),
+            "Mean Revenue": means.round(2),
+        }
+    )
@@ -1,3 +1,8 @@
+from typing import Callable, NamedTuple
+
+import numpy as np
+import pandas as pd
+
 from src.config import get_logger
 
 logger = get_logger(__name__)
@@ -30,3 +35,272 @@ def check_outliers(df, column, factor=1.5):
     logger.info(f"Outliers detected in {column}: {len(outliers)} rows")
 
     return outliers
+
+
+# ISO 639-1 codes plus the TMDB-specific 'cn' (Cantonese) and 'xx' (no language)
+ORIGINAL_LANGUAGES = frozenset(
+    """
+    aa ab ae af ak am an ar as av ay az ba be bg bh bi bm bn bo br bs ca ce ch cn co cr cs cu cv
+    cy da de dv dz ee el en eo es et eu fa ff fi fj fo fr fy ga gd gl gn gu gv ha he hi ho hr ht
+    hu hy hz ia id ie ig ii ik io is it iu ja jv ka kg ki kj kk kl km kn ko kr ks ku kv kw ky la
+    lb lg li ln lo lt lu lv mg mh mi mk ml mn mo mr ms mt my na nb nd ne ng nl nn no nr nv ny oc
+    oj om or os pa pi pl ps pt qu rm rn ro ru rw sa sc sd se sg sh si sk sl sm sn so sq sr ss st
+    su sv sw ta te tg th ti tk tl tn to tr ts tt tw ty ug uk ur uz ve vi vo wa wo xh xx yi yo za
+    zh zu
+    """.split()
+)
+
+
+class Rule(NamedTuple):
+    """
+    A declared data check.
+
+    Attributes:
+        name: Rule name used in summaries
+        columns: Columns the rule reads (the rule is skipped if any is missing)
+        check: Function of a ChunkColumns returning a boolean array, True = violation
+        unique: True for uniqueness rules, which the validator tracks across chunks
+    """
+
+    name: str
+    columns: tuple
+    check: Callable = None
+    unique: bool = False
+
+
+class ChunkColumns:
+    """
+    Column arrays of one validated chunk, each resolved at most once.
+
+    Rule checks read columns through this cache, so a column shared by
+    several rules (e.g., revenue_musd in a range rule and two formulas)
+    is converted once per chunk instead of once per rule.
+
+    Args:
+        df: DataFrame (or chunk) being validated
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self._cache = {}
+
+    def _cached(self, kind, column, compute):
+        key = (kind, column)
+        if key not in self._cache:
+            self._cache[key] = compute(self.df[column])
+        return self._cache[key]
+
+    def numeric(self, column):
+        """Column as a float64 array (unparseable values become NaN)."""
+        return self._cached(
+            "numeric",
+            column,
+            lambda series: pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan),
+        )
+
+    def missing(self, column):
+        """Boolean array, True where the column is missing."""
+        return self._cached("missing", column, lambda series: series.isna().to_numpy())
+
+    def series(self, column):
+        """The raw column."""
+        return self.df[column]
+
+
+def not_null(column):
+    """Rule: column must not be missing."""
+    return Rule(f"{column} not null", (column,), lambda columns: columns.missing(column))
+
+
+def in_range(column, min_value=None, max_value=None, min_inclusive=True, max_inclusive=True):
+    """Rule: non-missing values must lie within the given bounds."""
+
+    def check(columns):
+        values = columns.numeric(column)
+        violations = np.zeros(len(values), dtype=bool)
+        # Comparisons with NaN are False, so missing values never violate a range
+        if min_value is not None:
+            violations |= values < min_value if min_inclusive else values <= min_value
+        if max_value is not None:
+            violations |= values > max_value if max_inclusive else values >= max_value
+        return violations
+
+    low = "-inf" if min_value is None else min_value
+    high = "inf" if max_value is None else max_value
+    brackets = ("[" if min_inclusive else "(", "]" if max_inclusive else ")")
+    return Rule(f"{column} in {brackets[0]}{low}, {high}{brackets[1]}", (column,), check)
+
+
+def allowed_values(column, values):
+    """Rule: non-missing values must be one of the allowed values."""
+    allowed = list(values)
+
+    def check(columns):
+        return ~columns.missing(column) & ~columns.series(column).isin(allowed).to_numpy()
+
+    return Rule(f"{column} allowed values", (column,), check)
+
+
+def unique(column):
+    """Rule: non-missing values must not repeat, across all validated chunks."""
+    return Rule(f"{column} unique", (column,), unique=True)
+
+
+def matches_formula(column, formula, inputs, rtol=1e-6):
+    """Rule: column must equal formula(columns) wherever either side is present."""
+
+    def check(columns):
+        expected = np.asarray(formula(columns), dtype=np.float64)
+        return ~np.isclose(columns.numeric(column), expected, rtol=rtol, equal_nan=True)
+
+    return Rule(f"{column} matches formula", (column, *inputs), check)
+
+
+DEFAULT_RULES = [
+    not_null("id"),
+    not_null("title"),
+    unique("id"),
+    in_range("runtime", min_value=0, min_inclusive=False),
+    in_range("budget_musd", min_value=0, min_inclusive=False),
+    in_range("revenue_musd", min_value=0, min_inclusive=False),
+    in_range("vote_average", min_value=0, max_value=10),
+    in_range("vote_count", min_value=0),
+    in_range("popularity", min_value=0),
+    Rule(
+        "vote_count 0 implies no vote_average",
+        ("vote_count", "vote_average"),
+        lambda columns: (columns.numeric("vote_count") == 0) & ~columns.missing("vote_average"),
+    ),
+    matches_formula(
+        "profit",
+        lambda columns: columns.numeric("revenue_musd") - columns.numeric("budget_musd"),
+        ("revenue_musd", "budget_musd"),
+    ),
+    matches_formula(
+        "roi",
+        lambda columns: columns.numeric("revenue_musd") / columns.numeric("budget_musd"),
+        ("revenue_musd", "budget_musd"),
+    ),
+    allowed_values("original_language", ORIGINAL_LANGUAGES),
+]
+
+
+class DataValidator:
+    """
+    Runs a fixed set of rules over DataFrames or streamed chunks of one.
+
+    Every rule is a vectorized column expression, and each row's results
+    are packed into one uint64 bitmask (bit i = rule i violated). Running
+    totals and the values seen by uniqueness rules carry over between
+    calls, so validating chunk by chunk gives the same counts as
+    validating the whole frame at once.
+
+    Args:
+        rules: List of Rule objects (defaults to DEFAULT_RULES)
+    """
+
+    def __init__(self, rules=None):
+        self.rules = list(DEFAULT_RULES if rules is None else rules)
+        if len(self.rules) > 64:
+            raise ValueError("At most 64 rules fit in a uint64 bitmask")
+
+        self._bits = np.left_shift(np.uint64(1), np.arange(len(self.rules), dtype=np.uint64))
+        self.reset()
+
+    def reset(self):
+        """Clear running counts and uniqueness state."""
+        self.rows = 0
+        self._counts = np.zeros(len(self.rules), dtype=np.int64)
+        self._seen = {}
+        self._skipped = set()
+
+    def _unique_violations(self, columns, column):
+        present = ~columns.missing(column)
+        values = columns.series(column)[present]
+        positions = np.flatnonzero(present)
+
+        repeated = values.duplicated(keep="first").to_numpy().copy()
+        firsts = values.to_numpy()[~repeated].tolist()
+
+        # A set of earlier values makes each chunk cost O(chunk), however long the stream
+        seen = self._seen.setdefault(column, set())
+        earlier = np.fromiter((value in seen for value in firsts), dtype=bool, count=len(firsts))
+        seen.update(firsts)
+        repeated[np.flatnonzero(~repeated)[earlier]] = True
+
+        violations = np.zeros(len(present), dtype=bool)
+        violations[positions[repeated]] = True
+        return violations
+
+    def validate(self, df):
+        """
+        Validate a DataFrame or one chunk of a stream.
+
+        Args:
+            df: Movie DataFrame (or chunk)
+
+        Returns:
+            uint64 array with one violation bitmask per row
+        """
+        bitmask = np.zeros(len(df), dtype=np.uint64)
+        # Shared by all rules, so each column is converted once per chunk
+        columns = ChunkColumns(df)
+
+        for i, rule in enumerate(self.rules):
+            missing = [column for column in rule.columns if column not in df.columns]
+            if missing:
+                if rule.name not in self._skipped:
+                    logger.warning(f"Skipping rule '{rule.name}': columns {missing} not found.")
+                    self._skipped.add(rule.name)
+                continue
+
+            if rule.unique:
+                violations = self._unique_violations(columns, rule.columns[0])
+            else:
+                violations = np.asarray(rule.check(columns), dtype=bool)
+
+            bitmask[violations] |= self._bits[i]
+            self._counts[i] += violations.sum()
+
+        self.rows += len(df)
+        return bitmask
+
+    def summary(self):
+        """
+        Violation counts per rule over everything validated since the last reset.
+
+        Returns:
+            Series of violation counts indexed by rule name
+        """
+        return pd.Series(self._counts, index=[rule.name for rule in self.rules], name="violations")
+
+    def decode(self, bitmask):
+        """
+        List the names of the rules set in a row's bitmask.
+
+        Args:
+            bitmask: One value returned by validate()
+
+        Returns:
+            List of violated rule names
+        """
+        return [rule.name for rule, bit in zip(self.rules, self._bits) if int(bitmask) & int(bit)]
+
+
+def validate_data(df, rules=None):
+    """
+    Validate a DataFrame against a set of rules in one pass.
+
+    Args:
+        df: Movie DataFrame
+        rules: List of Rule objects (defaults to DEFAULT_RULES)
+
+    Returns:
+        Tuple of (per-row uint64 violation bitmask, Series of counts per rule)
+    """
+    validator = DataValidator(rules)
+    bitmask = validator.validate(df)
+    summary = validator.summary()
+
+    logger.info(f"Validated {len(df)} rows: {int((bitmask != 0).sum())} rows with violations")
+    return bitmask, summary
@@ -0,0 +1,377 @@
+"""
+Local HTTP/JSON query service over a preloaded movie dataset.
+
+The dataset is loaded once per process - from a snapshot directory
+(see snapshot.py) or a cleaned CSV - and queries are answered from memory:
+
+    python -m src.utils.service notebooks/cleaned_movies_data.csv --port 8000
+    curl 'http://127.0.0.1:8000/rank?metric=revenue_musd&top_n=5'
+
+Identical concurrent queries share one computation, finished results are
+kept in an LRU cache, and heavy aggregations run in a pool of worker
+processes so they never block the event loop. /stats reports latency
+percentiles per endpoint.
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import re
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from src.config import get_logger
+from src.utils.analysis import (
+    analyze_franchise_vs_standalone,
+    get_successful_directors,
+    get_successful_franchises,
+    rank_movies,
+    search_movies,
+)
+from src.utils.snapshot import MANIFEST, open_snapshot
+from src.utils.timeseries import ReleaseTrends
+
+logger = get_logger(__name__)
+
+# Dataset and derived indexes of the current process (main or worker)
+_dataset = None
+_trends = None
+
+
+def load_dataset(path):
+    """
+    Load a cleaned movie dataset from a snapshot directory or a CSV file.
+
+    Args:
+        path: Snapshot directory or cleaned CSV path
+
+    Returns:
+        Movie DataFrame
+    """
+    if os.path.isfile(os.path.join(path, MANIFEST)):
+        return open_snapshot(path)
+    return pd.read_csv(path, parse_dates=["release_date"])
+
+
+def _init_worker(path):
+    """Load the dataset once per worker process."""
+    global _dataset, _trends
+    _dataset = load_dataset(path)
+    _trends = None
+
+
+def _get_trends():
+    global _trends
+    if _trends is None:
+        _trends = ReleaseTrends(_dataset)
+    return _trends
+
+
+def _flag(value):
+    return value.lower() in ("1", "true", "yes")
+
+
+def _optional(params, name, convert=str):
+    return convert(params[name]) if name in params else None
+
+
+def _rank(df, params):
+    return rank_movies(
+        df,
+        params["metric"],
+        top_n=int(params.get("top_n", 5)),
+        ascending=_flag(params.get("ascending", "false")),
+        min_budget=_optional(params, "min_budget", float),
+        min_votes=_optional(params, "min_votes", int),
+    )
+
+
+def _literal(value):
+    """Escape user input so search_movies matches it as plain text, not a regex."""
+    return re.escape(value) if value else None
+
+
+def _search(df, params):
+    genres = params.get("genres")
+    results = search_movies(
+        df,
+        cast_member=_literal(params.get("cast_member")),
+        director=_literal(params.get("director")),
+        genres=[re.escape(genre) for genre in genres.split(",")] if genres else None,
+        sort_by=params.get("sort_by"),
+        ascending=_flag(params.get("ascending", "false")),
+    )
+    return results.head(int(params.get("top_n", 50)))
+
+
+def _franchises(df, params):
+    return get_successful_franchises(df).head(int(params.get("top_n", 50))).reset_index()
+
+
+def _directors(df, params):
+    return get_successful_directors(df).head(int(params.get("top_n", 50))).reset_index()
+
+
+def _franchise_vs_standalone(df, params):
+    return analyze_franchise_vs_standalone(df)
+
+
+def _trends_query(df, params):
+    trends = _get_trends().trends(
+        params.get("freq", "Y"),
+        rolling=_optional(params, "rolling", int),
+    )
+    trends.index = trends.index.astype(str)
+    return trends.reset_index()
+
+
+# Endpoint -> (query function, run in the process pool)
+ENDPOINTS = {
+    "/rank": (_rank, False),
+    "/search": (_search, False),
+    "/franchises": (_franchises, True),
+    "/directors": (_directors, True),
+    "/franchise-vs-standalone": (_franchise_vs_standalone, True),
+    "/trends": (_trends_query, True),
+}
+
+
+def run_query(endpoint, params):
+    """
+    Run an endpoint's query against this process's dataset.
+
+    Args:
+        endpoint: Key of ENDPOINTS
+        params: Dict of query-string parameters
+
+    Returns:
+        JSON string of the result rows
+    """
+    query, _ = ENDPOINTS[endpoint]
+    return query(_dataset, params).to_json(orient="records", date_format="iso")
+
+
+class AnalyticsService:
+    """
+    asyncio HTTP server answering analysis queries from a preloaded dataset.
+
+    Args:
+        data_path: Snapshot directory or cleaned CSV path
+        workers: Number of worker processes for heavy aggregations
+        cache_size: Number of query results kept in the LRU cache
+        latency_window: Number of recent requests per endpoint used for percentiles
+    """
+
+    def __init__(self, data_path, workers=2, cache_size=256, latency_window=1000):
+        self.data_path = data_path
+        self.workers = workers
+        self.cache_size = cache_size
+        self.latency_window = latency_window
+
+        self.executions = 0
+        self._cache = OrderedDict()
+        self._inflight = {}
+        self._latencies = {}
+        self._pool = None
+        self._server = None
+
+    async def start(self, host="127.0.0.1", port=8000):
+        """Load the dataset, start the worker pool and begin accepting connections."""
+        _init_worker(self.data_path)
+        logger.info(f"Loaded {len(_dataset)} movies from {self.data_path}")
+
+        self._pool = self._new_pool()
+        self._server = await asyncio.start_server(self._handle, host, port)
+        logger.info(f"Serving on {', '.join(str(s.getsockname()) for s in self._server.sockets)}")
+
+    def _new_pool(self):
+        # Spawned workers load the dataset themselves; forking a process that
+        # already runs executor threads can deadlock the child
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.data_path,),
+        )
+
+    @property
+    def port(self):
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        self._server.close()
+        await self._server.wait_closed()
+        # Joining the workers blocks, so it runs off the event loop
+        await asyncio.get_running_loop().run_in_executor(None, lambda: self._pool.shutdown(cancel_futures=True))
+
+    async def query(self, endpoint, params):
+        """
+        Answer a query from the cache, an identical in-flight query, or a new computation.
+
+        Args:
+            endpoint: Key of ENDPOINTS
+            params: Dict of query-string parameters
+
+        Returns:
+            JSON string of the result rows
+        """
+        key = (endpoint, tuple(sorted(params.items())))
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        # Coalesce: identical concurrent queries wait on the same computation
+        if key not in self._inflight:
+            self._inflight[key] = asyncio.ensure_future(self._compute(key, endpoint, params))
+
+        return await asyncio.shield(self._inflight[key])
+
+    async def _compute(self, key, endpoint, params):
+        self.executions += 1
+        _, heavy = ENDPOINTS[endpoint]
+        loop = asyncio.get_running_loop()
+
+        try:
+            if heavy:
+                result = await self._run_in_pool(endpoint, params)
+            else:
+                # Light queries use a thread so the event loop keeps serving
+                result = await loop.run_in_executor(None, run_query, endpoint, params)
+        finally:
+            del self._inflight[key]
+
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+        return result
+
+    async def _run_in_pool(self, endpoint, params):
+        """Run a query in the worker pool, replacing the pool once if a worker died."""
+        loop = asyncio.get_running_loop()
+        pool = self._pool
+
+        try:
+            return await loop.run_in_executor(pool, run_query, endpoint, params)
+        except BrokenProcessPool:
+            # Concurrent queries on the same broken pool replace it only once
+            if self._pool is pool:
+                logger.warning("Worker pool is broken, starting a new one")
+                self._pool = self._new_pool()
+                pool.shutdown(wait=False)
+            return await loop.run_in_executor(self._pool, run_query, endpoint, params)
+
+    def latency_stats(self):
+        """
+        Latency percentiles for each endpoint over the recent request window.
+
+        Returns:
+            Dict of endpoint -> request count and p50/p90/p99 in milliseconds
+        """
+        stats = {}
+        for endpoint, latencies in self._latencies.items():
+            p50, p90, p99 = np.percentile(np.array(latencies) * 1000, [50, 90, 99])
+            stats[endpoint] = {
+                "count": len(latencies),
+                "p50_ms": round(p50, 3),
+                "p90_ms": round(p90, 3),
+                "p99_ms": round(p99, 3),
+            }
+        return stats
+
+    def _record_latency(self, endpoint, seconds):
+        if endpoint not in self._latencies:
+            self._latencies[endpoint] = deque(maxlen=self.latency_window)
+        self._latencies[endpoint].append(seconds)
+
+    async def _handle(self, reader, writer):
+        started = time.perf_counter()
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            # Skip the headers, queries carry everything in the URL
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+
+            if len(request_line) < 2 or request_line[0] != "GET":
+                await self._respond(writer, 405, json.dumps({"error": "Only GET is supported"}))
+                return
+
+            url = urlsplit(request_line[1])
+            endpoint = url.path.rstrip("/") or "/"
+            params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+
+            if endpoint == "/stats":
+                await self._respond(writer, 200, json.dumps(self.latency_stats()))
+                return
+            if endpoint not in ENDPOINTS:
+                await self._respond(writer, 404, json.dumps({"error": f"Unknown endpoint '{endpoint}'"}))
+                return
+
+            try:
+                body = await self.query(endpoint, params)
+                status = 200
+            except (KeyError, ValueError, TypeError) as e:
+                body, status = json.dumps({"error": str(e)}), 400
+            except Exception as e:
+                # Anything else (e.g., a pool that broke again on retry) is our failure, not the client's
+                logger.error(f"Query {endpoint} failed: {type(e).__name__}: {e}")
+                body, status = json.dumps({"error": "Internal server error"}), 500
+
+            await self._respond(writer, status, body)
+            self._record_latency(endpoint, time.perf_counter() - started)
+        except Exception as e:
+            logger.error(f"Failed to handle request: {e}")
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, status, body):
+        reason = {
+            200: "OK",
+            400: "Bad Request",
+            404: "Not Found",
+            405: "Method Not Allowed",
+            500: "Internal Server Error",
+        }[status]
+        payload = body.encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status} {reason}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"Connection: close\r\n\r\n".encode("latin-1")
+            + payload
+        )
+        await writer.drain()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve movie analysis queries over HTTP")
+    parser.add_argument("data_path", help="Snapshot directory or cleaned CSV file")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--cache-size", type=int, default=256)
+    args = parser.parse_args()
+
+    async def serve():
+        service = AnalyticsService(args.data_path, workers=args.workers, cache_size=args.cache_size)
+        await service.start(args.host, args.port)
+        await service.serve_forever()
+
+    asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    main()
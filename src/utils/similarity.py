@@ -0,0 +1,223 @@
+"""
+"Movies like X" retrieval over sparse feature vectors.
+
+Each movie is described by one-hot blocks for its genres, cast, directors,
+production companies and collection plus a TF-IDF block for its overview.
+Rows are L2-normalized so cosine similarity is a plain sparse dot product.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from src.config import get_logger
+from src.utils.collaborations import build_incidence_matrix
+
+logger = get_logger(__name__)
+
+DEFAULT_WEIGHTS = {
+    "genres": 1.0,
+    "cast": 1.0,
+    "directors": 1.0,
+    "production_companies": 0.5,
+    "belongs_to_collection": 1.0,
+    "overview": 1.0,
+}
+
+
+def _normalize_rows(matrix):
+    """Scale every row of a sparse matrix to unit L2 norm (empty rows stay empty)."""
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.diags(1.0 / norms) @ matrix
+
+
+def build_tfidf_matrix(texts, min_df=2, max_df=0.5):
+    """
+    Build a TF-IDF matrix from free text.
+
+    Args:
+        texts: Series of documents (e.g., movie overviews)
+        min_df: Ignore terms found in fewer documents than this
+        max_df: Ignore terms found in more than this fraction of documents
+
+    Returns:
+        CSR matrix of shape (documents, terms) with unit-length rows
+    """
+    tokens = texts.fillna("").astype(str).str.lower().str.findall(r"[a-z0-9']{2,}")
+    lengths = tokens.str.len().to_numpy()
+    rows = np.repeat(np.arange(len(texts)), lengths)
+    codes, vocabulary = pd.factorize(tokens.explode().dropna().to_numpy())
+
+    counts = sparse.csr_matrix(
+        (np.ones(len(codes), dtype=np.float64), (rows, codes)),
+        shape=(len(texts), len(vocabulary)),
+    )
+    counts.sum_duplicates()
+
+    # Drop terms that are too rare or too common to separate movies
+    document_frequency = np.bincount(counts.indices, minlength=len(vocabulary))
+    keep = (document_frequency >= min_df) & (document_frequency <= max_df * len(texts))
+    counts = counts[:, keep]
+    document_frequency = document_frequency[keep]
+
+    idf = np.log((1 + len(texts)) / (1 + document_frequency)) + 1
+    return _normalize_rows(counts @ sparse.diags(idf)).tocsr()
+
+
+def build_feature_matrix(df, weights=None):
+    """
+    Build the sparse feature matrix used for similarity queries.
+
+    Args:
+        df: Cleaned movie DataFrame
+        weights: Dict of column -> block weight (defaults to DEFAULT_WEIGHTS)
+
+    Returns:
+        CSR float32 matrix of shape (movies, features) with unit-length rows
+    """
+    weights = DEFAULT_WEIGHTS if weights is None else weights
+    blocks = []
+
+    for column, weight in weights.items():
+        if column not in df.columns or not weight:
+            continue
+
+        if column == "overview":
+            block = build_tfidf_matrix(df[column])
+        else:
+            block, _ = build_incidence_matrix(df, column)
+            block = _normalize_rows(block)
+
+        blocks.append(block * weight)
+
+    features = _normalize_rows(sparse.hstack(blocks, format="csr"))
+    logger.info(f"Built similarity features: {features.shape[0]} movies, {features.shape[1]} features")
+
+    return features.astype(np.float32).tocsr()
+
+
+def _top_k_rows(scores, top_k):
+    """Return column indices and values of the top_k scores in each row, best first."""
+    top_k = min(top_k, scores.shape[1])
+    candidates = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+    candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+
+    order = np.argsort(-candidate_scores, axis=1, kind="stable")
+    return (
+        np.take_along_axis(candidates, order, axis=1),
+        np.take_along_axis(candidate_scores, order, axis=1),
+    )
+
+
+def compute_neighbor_index(features, top_k=10, batch_size=512):
+    """
+    Compute the top_k most similar movies for every movie.
+
+    Similarities are computed one block of rows at a time, so peak memory
+    is about batch_size x movies x 4 bytes.
+
+    Args:
+        features: Matrix from build_feature_matrix
+        top_k: Number of neighbors to keep per movie
+        batch_size: Rows scored per sparse matrix product
+
+    Returns:
+        Tuple of (neighbor positions, similarity scores), both (movies, top_k)
+    """
+    n_movies = features.shape[0]
+    top_k = min(top_k, n_movies - 1)
+    features_t = features.T.tocsc()
+
+    neighbors = np.empty((n_movies, top_k), dtype=np.int64)
+    scores = np.empty((n_movies, top_k), dtype=np.float32)
+
+    for start in range(0, n_movies, batch_size):
+        stop = min(start + batch_size, n_movies)
+        batch = (features[start:stop] @ features_t).toarray()
+
+        # A movie is never its own neighbor
+        batch[np.arange(stop - start), np.arange(start, stop)] = -np.inf
+
+        neighbors[start:stop], scores[start:stop] = _top_k_rows(batch, top_k)
+
+    return neighbors, scores
+
+
+def _index_path(path):
+    """np.savez appends .npz to paths without it; apply the same rule when loading."""
+    path = os.fspath(path)
+    return path if path.endswith(".npz") else f"{path}.npz"
+
+
+def save_neighbor_index(path, df, neighbors, scores):
+    """
+    Save a precomputed neighbor index to disk.
+
+    Args:
+        path: Output file path (.npz is appended if missing)
+        df: Movie DataFrame the index was built from
+        neighbors: Neighbor positions from compute_neighbor_index
+        scores: Similarity scores from compute_neighbor_index
+    """
+    path = _index_path(path)
+    np.savez(path, ids=df["id"].to_numpy(), neighbors=neighbors, scores=scores)
+    logger.info(f"Saved neighbor index for {len(neighbors)} movies to {path}")
+
+
+def load_neighbor_index(path, df):
+    """
+    Load a neighbor index saved with save_neighbor_index.
+
+    Args:
+        path: File path given to save_neighbor_index (.npz is appended if missing)
+        df: Movie DataFrame the index is used with
+
+    Returns:
+        Tuple of (neighbor positions, similarity scores)
+    """
+    with np.load(_index_path(path)) as index:
+        if not np.array_equal(index["ids"], df["id"].to_numpy()):
+            raise ValueError("Neighbor index was built for a different set of movies")
+        return index["neighbors"], index["scores"]
+
+
+def find_similar_movies(df, movie, features=None, top_k=10, neighbor_index=None):
+    """
+    Find the movies most similar to a given movie.
+
+    Args:
+        df: Cleaned movie DataFrame
+        movie: Movie title or TMDB id
+        features: Matrix from build_feature_matrix (built on the fly if None)
+        top_k: Number of similar movies to return
+        neighbor_index: Optional (neighbors, scores) tuple to answer from
+
+    Returns:
+        DataFrame of similar movies with a 'similarity' column
+    """
+    column = "title" if isinstance(movie, str) else "id"
+    matches = np.flatnonzero(df[column].to_numpy() == movie)
+    if len(matches) == 0:
+        raise KeyError(f"Movie '{movie}' not found")
+    position = matches[0]
+
+    if neighbor_index is not None and top_k <= neighbor_index[0].shape[1]:
+        neighbors = neighbor_index[0][position, :top_k]
+        scores = neighbor_index[1][position, :top_k]
+    else:
+        if features is None:
+            features = build_feature_matrix(df)
+
+        # Sparse matrix x dense vector is much cheaper than sparse x sparse here
+        row_scores = features @ features[position].toarray().ravel()
+        row_scores[position] = -np.inf
+        neighbors, scores = _top_k_rows(row_scores[np.newaxis, :], min(top_k, len(df) - 1))
+        neighbors, scores = neighbors[0], scores[0]
+
+    similar = df.iloc[neighbors].copy()
+    similar["similarity"] = np.round(scores, 4)
+
+    return similar
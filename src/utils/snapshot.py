@@ -0,0 +1,167 @@
+"""
+Memory-mapped snapshots of the cleaned movie dataset.
+
+A snapshot is a directory with one .npy file per numeric or datetime
+column, one Arrow IPC file holding every text column, and a JSON manifest
+naming the generation of files currently in use. Opening a snapshot maps
+the files instead of parsing them: numeric columns are views of their
+.npy files and text columns are Arrow string arrays over the mapped IPC
+file, so every process reading the same snapshot shares its pages through
+the OS page cache and strings are only decoded when they are used.
+
+Rewriting a snapshot never touches files that readers may have mapped:
+the new columns go to freshly named files, the manifest is swapped in
+atomically, and only then are the old files unlinked (open mappings keep
+their data until they are closed).
+"""
+
+import json
+import os
+import uuid
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from src.config import get_logger
+
+logger = get_logger(__name__)
+
+MANIFEST = "manifest.json"
+SNAPSHOT_VERSION = 3
+
+# Arrow-backed pandas string dtype with NaN for missing values (pandas' default "str")
+TEXT_DTYPE = pd.StringDtype("pyarrow", na_value=np.nan)
+
+
+def _column_file(path, name, generation):
+    return os.path.join(path, f"{name}.{generation}.npy")
+
+
+def _text_file(path, generation):
+    return os.path.join(path, f"text.{generation}.arrow")
+
+
+def _to_arrow_text(series):
+    """Convert a text column to an Arrow large_string array (missing values become nulls)."""
+    values = pa.array(series, from_pandas=True)
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+    return values.cast(pa.large_string())
+
+
+def write_snapshot(df, path):
+    """
+    Write a DataFrame (e.g., clean_movie_data output) as a snapshot.
+
+    Args:
+        df: Movie DataFrame
+        path: Snapshot directory (created if missing)
+    """
+    os.makedirs(path, exist_ok=True)
+    generation = uuid.uuid4().hex
+    columns = []
+    text_columns = {}
+
+    for name in df.columns:
+        series = df[name]
+
+        if pd.api.types.is_datetime64_any_dtype(series):
+            kind = "datetime"
+            np.save(_column_file(path, name, generation), series.to_numpy(dtype="datetime64[ns]"))
+        elif pd.api.types.is_bool_dtype(series) and not series.isna().any():
+            kind = "numeric"
+            np.save(_column_file(path, name, generation), series.to_numpy(dtype=bool))
+        elif pd.api.types.is_numeric_dtype(series):
+            kind = "numeric"
+            # Nullable integer columns fall back to float so missing values survive
+            values = series.to_numpy()
+            if values.dtype == object:
+                values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            np.save(_column_file(path, name, generation), values)
+        else:
+            kind = "string"
+            text_columns[name] = _to_arrow_text(series)
+
+        columns.append({"name": name, "kind": kind})
+
+    # One uncompressed record batch, so mapped columns are single contiguous arrays
+    if text_columns:
+        table = pa.table(text_columns)
+        with pa.OSFile(_text_file(path, generation), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table, max_chunksize=max(len(table), 1))
+
+    # Readers switch to the new files in one step when the manifest is replaced
+    manifest = {"version": SNAPSHOT_VERSION, "generation": generation, "rows": len(df), "columns": columns}
+    manifest_path = os.path.join(path, MANIFEST)
+    temp_path = f"{manifest_path}.{generation}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(temp_path, manifest_path)
+
+    # Unlinking (never truncating) old files leaves existing mappings intact
+    for file_name in os.listdir(path):
+        if file_name.endswith((".npy", ".arrow")) and generation not in file_name:
+            try:
+                os.remove(os.path.join(path, file_name))
+            except OSError as e:
+                logger.warning(f"Could not remove old snapshot file {file_name}: {e}")
+
+    logger.info(f"Wrote snapshot of {len(df)} movies, {len(columns)} columns to {path}")
+
+
+def _load_columns(path, manifest, columns):
+    """Map the columns of a parsed manifest into a DataFrame."""
+    if manifest["version"] != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version {manifest['version']}")
+
+    available = {column["name"]: column for column in manifest["columns"]}
+    names = list(available) if columns is None else columns
+    missing = [name for name in names if name not in available]
+    if missing:
+        raise KeyError(f"Columns not in snapshot: {missing}")
+
+    generation = manifest["generation"]
+    text = None
+    data = {}
+    for name in names:
+        if available[name]["kind"] == "string":
+            if text is None:
+                # read_all over a memory map references the mapped pages, it copies nothing
+                text = pa.ipc.open_file(pa.memory_map(_text_file(path, generation))).read_all()
+            data[name] = text.column(name).to_pandas(types_mapper={pa.large_string(): TEXT_DTYPE}.get)
+        else:
+            data[name] = np.load(_column_file(path, name, generation), mmap_mode="c")
+
+    # copy=False keeps one block per column, each a view of its mapped file
+    return pd.DataFrame(data, columns=names, copy=False)
+
+
+def open_snapshot(path, columns=None):
+    """
+    Open a snapshot as a DataFrame backed by memory-mapped files.
+
+    Numeric and datetime columns are views of the mapped .npy files, so
+    opening is near-instant and costs no private memory until a value is
+    modified (pages are mapped copy-on-write and the files on disk are
+    never changed). Text columns come back as Arrow-backed 'str' columns
+    over the mapped IPC file; setting a value copies only that column.
+
+    Args:
+        path: Snapshot directory written by write_snapshot
+        columns: Optional list of columns to load (default: all)
+
+    Returns:
+        DataFrame with the snapshot data
+    """
+    with open(os.path.join(path, MANIFEST)) as f:
+        manifest = json.load(f)
+
+    try:
+        return _load_columns(path, manifest, columns)
+    except FileNotFoundError:
+        # A concurrent write_snapshot replaced the files after the manifest was read
+        with open(os.path.join(path, MANIFEST)) as f:
+            manifest = json.load(f)
+        return _load_columns(path, manifest, columns)
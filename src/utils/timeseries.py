@@ -0,0 +1,178 @@
+"""
+Release-date trend analytics backed by monthly prefix sums.
+
+Movies are binned by release month and running totals are kept for each
+metric, so any window of months (a quarter, a year, a rolling N-month
+span) is answered with two array lookups instead of a groupby.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Output column -> source column for the averaged metrics
+METRICS = {
+    "Mean Revenue": "revenue_musd",
+    "Mean Budget": "budget_musd",
+    "Mean ROI": "roi",
+}
+
+# Months per period for the supported frequencies
+FREQUENCIES = {"M": 1, "Q": 3, "Y": 12}
+
+
+def _release_months(df):
+    """Return absolute month numbers (year * 12 + month - 1) and the rows that have one."""
+    dates = pd.to_datetime(df["release_date"], errors="coerce")
+    has_date = dates.notna().to_numpy()
+    dates = dates[has_date]
+    months = dates.dt.year.to_numpy() * 12 + dates.dt.month.to_numpy() - 1
+    return months.astype(np.int64), has_date
+
+
+def _month_starts(months):
+    """Convert absolute month numbers to first-of-month timestamps."""
+    return pd.to_datetime({"year": months // 12, "month": months % 12 + 1, "day": 1})
+
+
+class ReleaseTrends:
+    """
+    Prefix-sum index of movie metrics over release months.
+
+    For every month the index stores the movie count plus the sum and
+    number of non-missing values of each metric in METRICS. Prefix sums
+    over those bins make every window query O(1).
+
+    Args:
+        df: Optional movie DataFrame with 'release_date' and metric columns
+    """
+
+    def __init__(self, df=None):
+        self._first_month = None
+        # Rows: movie count, then (sum, non-missing count) for each metric
+        self._bins = np.zeros((1 + 2 * len(METRICS), 0))
+        self._prefix = np.zeros((1 + 2 * len(METRICS), 1))
+
+        if df is not None:
+            self.append(df)
+
+    @property
+    def n_months(self):
+        """Number of months covered by the index."""
+        return self._bins.shape[1]
+
+    def append(self, df):
+        """
+        Add newly released movies to the index.
+
+        Only the prefix sums from the earliest affected month onwards are
+        recomputed, so appending recent movies is cheap.
+
+        Args:
+            df: Movie DataFrame with 'release_date' and metric columns
+        """
+        months, has_date = _release_months(df)
+        if len(months) == 0:
+            return
+
+        old_first, old_size = self._first_month, self.n_months
+        if old_first is None:
+            first, last = months.min(), months.max()
+        else:
+            first = min(old_first, months.min())
+            last = max(old_first + old_size - 1, months.max())
+
+        # Grow the bins to cover the new months on either side
+        before = 0 if old_first is None else old_first - first
+        after = last - first + 1 - before - old_size
+        self._bins = np.pad(self._bins, ((0, 0), (before, after)))
+        self._first_month = first
+
+        offsets = months - first
+        size = self.n_months
+        updates = [np.bincount(offsets, minlength=size)]
+        for column in METRICS.values():
+            values = df[column].to_numpy(dtype=np.float64)[has_date]
+            present = ~np.isnan(values)
+            updates.append(np.bincount(offsets, weights=np.where(present, values, 0.0), minlength=size))
+            updates.append(np.bincount(offsets, weights=present, minlength=size))
+        self._bins += np.vstack(updates)
+
+        # Prefix sums before the earliest touched month are still valid
+        start = 0 if before > 0 or old_first is None else min(offsets.min(), old_size)
+        prefix = np.zeros((self._bins.shape[0], size + 1))
+        prefix[:, : start + 1] = self._prefix[:, : start + 1]
+        prefix[:, start + 1 :] = prefix[:, [start]] + np.cumsum(self._bins[:, start:], axis=1)
+        self._prefix = prefix
+
+    def _window_sums(self, first_months, last_months):
+        """Totals for inclusive month windows, clipped to the indexed range."""
+        lo = np.clip(np.asarray(first_months) - self._first_month, 0, self.n_months)
+        hi = np.clip(np.asarray(last_months) - self._first_month + 1, 0, self.n_months)
+        hi = np.maximum(hi, lo)
+        return self._prefix[:, hi] - self._prefix[:, lo]
+
+    def _summarize(self, sums, count_metric=None):
+        """Turn window totals into the count and mean metrics."""
+        if count_metric is None:
+            counts = sums[0]
+        elif count_metric in METRICS.values():
+            counts = sums[2 + 2 * list(METRICS.values()).index(count_metric)]
+        else:
+            raise ValueError(f"Unknown count_metric '{count_metric}', expected one of {list(METRICS.values())}")
+
+        summary = {"Movie Count": counts.astype(int)}
+        with np.errstate(invalid="ignore", divide="ignore"):
+            for i, name in enumerate(METRICS):
+                summary[name] = sums[1 + 2 * i] / sums[2 + 2 * i]
+        return summary
+
+    def window(self, start, end):
+        """
+        Summarize movies released between two dates (whole months, inclusive).
+
+        Args:
+            start: First date of the window
+            end: Last date of the window
+
+        Returns:
+            Dict with 'Movie Count' and the mean metrics
+        """
+        if self._first_month is None:
+            raise ValueError("No movies with a release date have been added")
+
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        sums = self._window_sums(start.year * 12 + start.month - 1, end.year * 12 + end.month - 1)
+
+        return {name: value.item() for name, value in self._summarize(sums).items()}
+
+    def trends(self, freq="Y", rolling=None, count_metric=None):
+        """
+        Summarize movies per period.
+
+        Args:
+            freq: Period length - 'M' (monthly), 'Q' (quarterly) or 'Y' (yearly)
+            rolling: Optional trailing window in months ending at each period end
+            count_metric: Optional METRICS source column (e.g., 'revenue_musd');
+                'Movie Count' then only counts movies with a value in it
+
+        Returns:
+            DataFrame indexed by period with 'Movie Count' and the mean metrics
+        """
+        if freq not in FREQUENCIES:
+            raise ValueError(f"Unknown frequency '{freq}', expected one of {list(FREQUENCIES)}")
+        if self._first_month is None:
+            index = pd.PeriodIndex([], freq=freq, name="release_period")
+            return pd.DataFrame(self._summarize(np.zeros((self._bins.shape[0], 0)), count_metric), index=index)
+
+        step = FREQUENCIES[freq]
+        first = self._first_month - self._first_month % step
+        last = self._first_month + self.n_months - 1
+
+        period_starts = np.arange(first, last + 1, step)
+        period_ends = period_starts + step - 1
+        window_starts = period_starts if rolling is None else period_ends - rolling + 1
+
+        sums = self._window_sums(window_starts, period_ends)
+        index = pd.DatetimeIndex(_month_starts(period_starts)).to_period(freq).rename("release_period")
+
+        return pd.DataFrame(self._summarize(sums, count_metric), index=index)
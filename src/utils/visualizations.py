@@ -5,6 +5,10 @@ Visualization utilities for movie data analysis.
 import matplotlib.pyplot as plt
 import numpy as np
 
+from src.utils.analysis import is_franchise
+from src.utils.bootstrap import compare_franchise_vs_standalone
+from src.utils.timeseries import ReleaseTrends
+
 
 def plot_revenue_vs_budget(df):
     """
@@ -61,28 +65,48 @@ def plot_roi_by_genre(df):
     plt.show()
 
 
-def plot_franchise_comparison(df):
+def plot_franchise_comparison(df, show_ci=False, n_resamples=2000):
     """
     Create multi-panel comparison of franchise vs standalone performance.
 
     Args:
         df: Movie DataFrame with franchise indicators
+        show_ci: Draw 95% bootstrap confidence intervals of the means as error bars
+        n_resamples: Bootstrap resamples used for the error bars
     """
+    columns = {
+        "Revenue": "revenue_musd",
+        "ROI": "roi",
+        "Budget": "budget_musd",
+        "Rating": "vote_average",
+    }
+
     # get franchise and standalone movies
-    franchise = df[df["belongs_to_collection"].notna()]
-    standalone = df[df["belongs_to_collection"].isna()]
+    franchise = df[is_franchise(df)]
+    standalone = df[~is_franchise(df)]
 
     # calculate metrics
     metrics = {
-        "Revenue": [
-            franchise["revenue_musd"].mean(),
-            standalone["revenue_musd"].mean(),
-        ],
-        "ROI": [franchise["roi"].mean(), standalone["roi"].mean()],
-        "Budget": [franchise["budget_musd"].mean(), standalone["budget_musd"].mean()],
-        "Rating": [franchise["vote_average"].mean(), standalone["vote_average"].mean()],
+        name: [franchise[column].mean(), standalone[column].mean()]
+        for name, column in columns.items()
     }
 
+    # error bars as distances from the mean to each end of its interval
+    errors = {name: None for name in columns}
+    if show_ci:
+        intervals = compare_franchise_vs_standalone(
+            df,
+            metrics={column: name for name, column in columns.items()},
+            statistics=("mean",),
+            n_resamples=n_resamples,
+        ).set_index(["Metric", "Type"])
+        for name in columns:
+            bounds = intervals.loc[name].reindex(["Franchise", "Standalone"])
+            errors[name] = [
+                (bounds["Estimate"] - bounds["CI Lower"]).clip(lower=0).to_numpy(),
+                (bounds["CI Upper"] - bounds["Estimate"]).clip(lower=0).to_numpy(),
+            ]
+
     # Create subplots
     fig, axs = plt.subplots(2, 2, figsize=(12, 10))
     fig.suptitle(
@@ -93,25 +117,33 @@ def plot_franchise_comparison(df):
     colors = ["#2E86AB", "#A23B72"]
 
     # Revenue comparison
-    axs[0, 0].bar(categories, metrics["Revenue"], color=colors, edgecolor="black")
+    axs[0, 0].bar(
+        categories, metrics["Revenue"], yerr=errors["Revenue"], capsize=6, color=colors, edgecolor="black"
+    )
     axs[0, 0].set_title("Average Revenue (M USD)")
     axs[0, 0].set_ylabel("Million USD")
     axs[0, 0].grid(True, axis="y", alpha=0.3)
 
     # ROI comparison
-    axs[0, 1].bar(categories, metrics["ROI"], color=colors, edgecolor="black")
+    axs[0, 1].bar(
+        categories, metrics["ROI"], yerr=errors["ROI"], capsize=6, color=colors, edgecolor="black"
+    )
     axs[0, 1].set_title("Average ROI")
     axs[0, 1].set_ylabel("ROI Multiplier")
     axs[0, 1].grid(True, axis="y", alpha=0.3)
 
     # Budget comparison
-    axs[1, 0].bar(categories, metrics["Budget"], color=colors, edgecolor="black")
+    axs[1, 0].bar(
+        categories, metrics["Budget"], yerr=errors["Budget"], capsize=6, color=colors, edgecolor="black"
+    )
     axs[1, 0].set_title("Average Budget (M USD)")
     axs[1, 0].set_ylabel("Million USD")
     axs[1, 0].grid(True, axis="y", alpha=0.3)
 
     # Rating comparison
-    axs[1, 1].bar(categories, metrics["Rating"], color=colors, edgecolor="black")
+    axs[1, 1].bar(
+        categories, metrics["Rating"], yerr=errors["Rating"], capsize=6, color=colors, edgecolor="black"
+    )
     axs[1, 1].set_title("Average Rating")
     axs[1, 1].set_ylabel("Rating (out of 10)")
     axs[1, 1].set_ylim(0, 10)
@@ -141,23 +173,22 @@ def plot_popularity_vs_rating(df):
     plt.show()
 
 
-def plot_yearly_trends(df):
+def plot_yearly_trends(df, trends=None):
     """
     Plot yearly trends in box office performance.
 
     Args:
         df: Movie DataFrame
+        trends: Optional prebuilt ReleaseTrends index (built from df if None)
     """
-    # Extract year from release date
-    df_copy = df.copy()
-    df_copy["release_year"] = df_copy["release_date"].dt.year
-
-    # Group by year and calculate metrics
-    yearly_stats = df_copy.groupby("release_year").agg(
-        {"revenue_musd": ["count", "mean"], "budget_musd": "mean", "roi": "mean"}
-    )
-
-    yearly_stats.columns = ["Movie Count", "Mean Revenue", "Mean Budget", "Mean ROI"]
+    if trends is None:
+        trends = ReleaseTrends(df)
+
+    # Yearly windows from the prefix-sum index, skipping years without releases;
+    # movies are counted when their revenue is known, as in the per-year groupby
+    released = trends.trends("Y")["Movie Count"] > 0
+    yearly_stats = trends.trends("Y", count_metric="revenue_musd")[released]
+    yearly_stats.index = yearly_stats.index.year
 
     # Create subplots
     fig, axs = plt.subplots(2, 2, figsize=(12, 10))